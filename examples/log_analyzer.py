@@ -10,126 +10,767 @@ import json
 import subprocess
 import sys
 import argparse
-from datetime import datetime, timedelta
+import contextlib
+import gc
+import hashlib
+import heapq
+import itertools
+import math
+import os
+import shutil
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Dict, List, Any
-import matplotlib.pyplot as plt
-import pandas as pd
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+from xml.sax.saxutils import escape
+
+try:
+    import ijson
+    JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:  # fall back to buffering the whole document
+    ijson = None
+    JSON_ERRORS = (ValueError,)
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # the stdlib decoder accepts bytes as well
+    orjson = None
+    json_loads = json.loads
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    ENTRY_SCHEMA = pa.schema([
+        ('path', pa.string()),
+        ('size', pa.int64()),
+        ('is_dir', pa.bool_()),
+        ('modified', pa.string()),
+        ('permissions', pa.int64()),
+        ('file_type', pa.dictionary(pa.int32(), pa.string()))
+    ])
+except ImportError:  # entries are not persisted for re-analysis
+    pa = None
+
+# Rows buffered per Parquet row group while streaming entries
+PARQUET_BATCH_ROWS = 64 * 1024
+
+# Where --cache stores collected results, following the XDG convention
+DEFAULT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'rfstat'
+
+# Rotation bucket for each log extension, indexing the tallies in _scan_entries:
+# current logs, compressed logs and numbered rotations
+BUCKET_CURRENT, BUCKET_COMPRESSED, BUCKET_ROTATED = range(3)
+LOG_BUCKETS = {
+    'log': BUCKET_CURRENT,
+    'gz': BUCKET_COMPRESSED,
+    '1': BUCKET_ROTATED,
+    '2': BUCKET_ROTATED,
+    '3': BUCKET_ROTATED,
+    '4': BUCKET_ROTATED,
+    '5': BUCKET_ROTATED
+}
+
+# Canvas size and series colors of the SVG charts
+SVG_WIDTH, SVG_HEIGHT = 600, 300
+SVG_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+              '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf')
+
+@dataclass(slots=True, frozen=True)
+class LogEntry:
+    """A single file reported by rfstat, without the per-instance dict of a JSON object."""
+    path: str
+    size: int
+    is_dir: bool
+    file_type: Optional[str]
+    modified: str
+
+    @classmethod
+    def from_dict(cls, entry: Dict[str, Any]) -> 'LogEntry':
+        """Build from a decoded rfstat entry, ignoring fields the analysis does not use.
+
+        file_type is interned so the handful of distinct extensions share
+        one string object and dict lookups on them hit the identity check.
+        """
+        file_type = entry.get('file_type')
+        return cls(entry['path'], entry['size'], entry['is_dir'],
+                   sys.intern(file_type) if file_type else None,
+                   entry.get('modified', ''))
+
+    @property
+    def size_mb(self) -> float:
+        return self.size / (1024 * 1024)
+
+def _build_value(events, event: str, value: Any) -> Any:
+    """Assemble one JSON value from an ijson event stream starting at `event`."""
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1 if event in ('start_map', 'start_array') else 0
+    while depth:
+        _, event, value = next(events)
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+    return builder.value
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize `obj` to UTF-8 encoded JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+def iter_rfstat_jsonl(stream) -> Iterator[Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]]:
+    """Split rfstat's JSON Lines output into a (summary, entries) pair per path.
+
+    Each section starts with a summary record, recognizable by its
+    `total_files` field. As with itertools.groupby, a section's entries must
+    be consumed before advancing to the next one.
+    """
+    section = 0
+
+    def section_of(record: Dict[str, Any]) -> int:
+        nonlocal section
+        if 'total_files' in record:
+            section += 1
+        return section
+
+    for _, records in itertools.groupby(map(json_loads, stream), section_of):
+        yield next(records), records
+
+def iter_rfstat_json(stream, summary: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield rfstat's entries one at a time from a binary JSON stream.
+
+    Every other top-level field (totals, size distribution, file types) is
+    stored in `summary`. rfstat serializes these before `entries`, so they
+    are available as soon as the first entry is yielded.
+    """
+    events = ijson.parse(stream)
+    for prefix, event, value in events:
+        if prefix == '' and event == 'map_key' and value != 'entries':
+            key = value
+            _, event, value = next(events)
+            summary[key] = _build_value(events, event, value)
+        elif prefix == 'entries.item' and event == 'start_map':
+            yield _build_value(events, event, value)
+
+@cache
+def rfstat_available() -> bool:
+    """Whether an rfstat executable is on PATH, looked up once per process."""
+    return shutil.which('rfstat') is not None
+
+def _svg_document(title: str, elements: List[str]) -> str:
+    """Wrap chart elements in an SVG document with a centered title."""
+    return '\n'.join([
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {SVG_WIDTH} {SVG_HEIGHT}" '
+        f'width="{SVG_WIDTH}" height="{SVG_HEIGHT}" font-family="sans-serif" font-size="12">',
+        f'<rect width="{SVG_WIDTH}" height="{SVG_HEIGHT}" fill="white"/>',
+        f'<text x="{SVG_WIDTH // 2}" y="20" text-anchor="middle" font-size="16">{escape(title)}</text>',
+        *elements,
+        '</svg>\n'
+    ])
+
+def _svg_pie(sizes: List[int], labels: List[str], path: Path, title: str = ''):
+    """Write a pie chart of `sizes`, starting at 12 o'clock, with a legend on the right."""
+    cx, cy, r = 160, 165, 120
+    total = sum(sizes)
+    elements = []
+    angle = 0.0
+    for index, (size, label) in enumerate(zip(sizes, labels)):
+        color = SVG_COLORS[index % len(SVG_COLORS)]
+        if size:
+            share = size / total
+            if share == 1:
+                # A single slice cannot be drawn as an arc from a point to itself
+                elements.append(f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{color}"/>')
+            else:
+                end = angle + 2 * math.pi * share
+                x0, y0 = cx + r * math.sin(angle), cy - r * math.cos(angle)
+                x1, y1 = cx + r * math.sin(end), cy - r * math.cos(end)
+                large_arc = int(share > 0.5)
+                elements.append(
+                    f'<path d="M{cx},{cy} L{x0:.2f},{y0:.2f} '
+                    f'A{r},{r} 0 {large_arc},1 {x1:.2f},{y1:.2f} Z" fill="{color}"/>')
+                angle = end
+
+        y = 60 + 24 * index
+        percent = f'{100 * size / total:.1f}%' if total else '0.0%'
+        elements.append(f'<rect x="330" y="{y - 11}" width="14" height="14" fill="{color}"/>')
+        elements.append(f'<text x="352" y="{y}">{escape(label)}: {size} ({percent})</text>')
+
+    if not total:
+        elements.append(f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="none" stroke="#7f7f7f"/>')
+
+    path.write_text(_svg_document(title, elements))
+
+def _svg_bar(categories: List[str], counts: List[int], path: Path, title: str = ''):
+    """Write a bar chart of `counts`, scaled to the tallest bar."""
+    left, right, top, bottom = 50, 20, 40, 50
+    plot_width = SVG_WIDTH - left - right
+    plot_height = SVG_HEIGHT - top - bottom
+    baseline = top + plot_height
+    slot = plot_width / max(len(categories), 1)
+    tallest = max(counts, default=0) or 1
+
+    elements = [f'<line x1="{left}" y1="{baseline}" x2="{SVG_WIDTH - right}" '
+                f'y2="{baseline}" stroke="black"/>']
+    for index, (category, count) in enumerate(zip(categories, counts)):
+        height = plot_height * count / tallest
+        x = left + slot * index + slot * 0.1
+        center = x + slot * 0.4
+        elements.append(f'<rect x="{x:.2f}" y="{baseline - height:.2f}" width="{slot * 0.8:.2f}" '
+                        f'height="{height:.2f}" fill="{SVG_COLORS[0]}"/>')
+        elements.append(f'<text x="{center:.2f}" y="{baseline - height - 4:.2f}" '
+                        f'text-anchor="middle">{count}</text>')
+        elements.append(f'<text x="{center:.2f}" y="{baseline + 16}" '
+                        f'text-anchor="middle">{escape(category)}</text>')
+
+    path.write_text(_svg_document(title, elements))
 
 class LogAnalyzer:
     """Analyzes log directories using rfstat and generates reports."""
     
-    def __init__(self, log_dir: str):
+    def __init__(self, log_dir: str, threshold_mb: int = 100, max_keep: int = 1000,
+                 concurrency: int = 1, recursive: bool = True, cache_dir: str = None):
         self.log_dir = Path(log_dir)
+        self.threshold_mb = threshold_mb
+        self.max_keep = max_keep
+        self.concurrency = concurrency
+        self.recursive = recursive
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.rfstat_data = None
+        self._rotation_stats = None
+        self._large_logs = None
+        # Modification stamp of log_dir when collection started (with a cache_dir)
+        self._stamp = None
+        # Memoized analyzer results, cleared whenever stats are re-collected
+        self._growth_patterns = None
+        self._large_logs_by_query = {}
         
     def collect_stats(self) -> Dict[str, Any]:
-        """Collect statistics using rfstat."""
-        try:
-            result = subprocess.run([
-                'rfstat', str(self.log_dir),
-                '--format', 'json',
-                '--extensions', 'log,gz,1,2,3,4,5',
-                '--show-times'
-            ], capture_output=True, text=True, check=True)
-            
-            self.rfstat_data = json.loads(result.stdout)
+        """Collect statistics using rfstat.
+
+        Rotation stats come from rfstat's per-type totals and large logs
+        from its `top_files`, so individual entries are not transferred at
+        all. With an older rfstat, or when entries are kept as Parquet, the
+        output is parsed as it is produced; entries are folded into the
+        rotation and large-file tallies and then discarded.
+
+        With `concurrency` > 1, each immediate subdirectory is scanned by a
+        separate rfstat process and the partial results are merged.
+
+        With a `cache_dir`, results are reused until the modification time
+        of `log_dir` or one of its immediate entries changes. Growth of
+        files in nested subdirectories is not detected. If pyarrow is
+        installed the entries are also kept as Parquet, so a different
+        threshold can be applied without running rfstat again.
+        """
+        if self._load_fresh_cache():
             return self.rfstat_data
-            
+
+        subdirs = []
+        if self.concurrency > 1 and self.recursive and self.log_dir.is_dir():
+            subdirs = [sub for sub in self.log_dir.iterdir()
+                       if sub.is_dir() and not sub.is_symlink()]
+        with self._exit_on_rfstat_error():
+            if subdirs:
+                summary = self._collect_parallel(subdirs)
+            else:
+                summaries = self._collect_sections([self])
+                # rfstat predates --format jsonl; parse its JSON document instead
+                summary = summaries[0] if summaries else self._collect_json()
+
+        return self._store(summary)
+
+    @classmethod
+    def collect_batch(cls, analyzers: List['LogAnalyzer']):
+        """Collect several directories with a single rfstat invocation.
+
+        Analyzers with a fresh cache skip rfstat, and those configured for
+        parallel or non-recursive collection run on their own. If rfstat
+        accepts only one path, every analyzer falls back to collect_stats.
+        """
+        pending = [analyzer for analyzer in analyzers if not analyzer._load_fresh_cache()]
+        batch = [analyzer for analyzer in pending
+                 if analyzer.concurrency <= 1 and analyzer.recursive]
+        others = [analyzer for analyzer in pending if analyzer not in batch]
+
+        if len(batch) > 1:
+            with cls._exit_on_rfstat_error():
+                summaries = cls._collect_sections(batch)
+
+            if summaries is None:
+                others += batch
+            else:
+                for analyzer, summary in zip(batch, summaries):
+                    analyzer._store(summary)
+        else:
+            others += batch
+
+        for analyzer in others:
+            analyzer.collect_stats()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _exit_on_rfstat_error():
+        """Report a failed rfstat run or unparsable output and exit."""
+        try:
+            yield
         except subprocess.CalledProcessError as e:
             print(f"Error running rfstat: {e}")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except JSON_ERRORS as e:
             print(f"Error parsing rfstat output: {e}")
             sys.exit(1)
-    
-    def analyze_log_rotation(self) -> Dict[str, Any]:
-        """Analyze log rotation patterns."""
-        if not self.rfstat_data:
-            self.collect_stats()
-        
-        rotation_stats = {
-            'current_logs': 0,
-            'rotated_logs': 0,
-            'compressed_logs': 0,
-            'total_current_size': 0,
-            'total_rotated_size': 0,
-            'rotation_efficiency': 0
+
+    def _load_fresh_cache(self) -> bool:
+        """Reset memoized results, then restore them from the cache if still fresh."""
+        self._growth_patterns = None
+        self._large_logs_by_query = {}
+
+        if not self.cache_dir:
+            return False
+        self._stamp = self._dir_stamp()
+        return self._load_cache(self._stamp)
+
+    def _store(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep a freshly collected summary and write it to the cache, if enabled."""
+        self.rfstat_data = summary
+        if self.cache_dir:
+            self._save_cache(self._stamp)
+        return self.rfstat_data
+
+    @property
+    def _cache_path(self) -> Path:
+        """Cache file for this directory, named by a hash of its absolute path."""
+        key = hashlib.sha1(str(self.log_dir.resolve()).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _dir_stamp(self) -> int:
+        """Latest modification time (ns) of log_dir and its immediate entries."""
+        stamp = self.log_dir.stat().st_mtime_ns
+        if not self.log_dir.is_dir():
+            return stamp
+        with os.scandir(self.log_dir) as it:
+            for entry in it:
+                try:
+                    stamp = max(stamp, entry.stat(follow_symlinks=False).st_mtime_ns)
+                except FileNotFoundError:
+                    # Rotated away between the listing and the stat
+                    continue
+        return stamp
+
+    def _load_cache(self, stamp: int) -> bool:
+        """Restore collected results from the cache if they are still fresh."""
+        try:
+            with open(self._cache_path, 'rb') as f:
+                cached = json_loads(f.read())
+        except (OSError, ValueError):
+            return False
+
+        if cached.get('stamp') != stamp:
+            return False
+
+        if (cached.get('threshold_mb') == self.threshold_mb and
+                cached.get('max_keep') == self.max_keep):
+            self._large_logs = [tuple(item) for item in cached['large_logs']]
+        elif not self._load_parquet_large_logs(stamp):
+            return False
+
+        self.rfstat_data = cached['rfstat_data']
+        self._rotation_stats = cached['rotation_stats']
+        return True
+
+    def _load_parquet_large_logs(self, stamp: int) -> bool:
+        """Rebuild the large-log heap from persisted entries for the current threshold."""
+        path = self._cache_path.with_suffix('.parquet')
+        if pa is None or not path.exists():
+            return False
+        try:
+            metadata = pq.read_schema(path).metadata or {}
+            if metadata.get(b'stamp') != str(stamp).encode():
+                return False
+            # The size filter is pushed down, so row groups of small files are skipped
+            table = pq.read_table(
+                path,
+                columns=['size', 'path', 'file_type', 'modified'],
+                filters=[('is_dir', '=', False),
+                         ('size', '>', self.threshold_mb * 1024 * 1024)]
+            )
+        except (OSError, pa.ArrowException):
+            return False
+
+        table = table.filter(pc.is_in(table['file_type'].cast(pa.string()),
+                                      value_set=pa.array(list(LOG_BUCKETS))))
+        table = table.take(pc.select_k_unstable(table, self.max_keep, [('size', 'descending')]))
+        self._large_logs = list(zip(*(table[name].to_pylist() for name in table.column_names)))
+        heapq.heapify(self._large_logs)
+        return True
+
+    def _persist_entries(self, entries: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Pass entries through unchanged while writing them to the Parquet cache.
+
+        As in _save_cache, a failed write only costs a future rescan: it is
+        reported and the remaining entries are still passed through. The
+        partial file is removed on failure or if the generator is closed early.
+        """
+        if not self._keeps_entries:
+            yield from entries
+            return
+
+        path = self._cache_path.with_suffix('.parquet')
+        tmp_path = path.with_suffix('.parquet.tmp')
+        schema = ENTRY_SCHEMA.with_metadata({'stamp': str(self._stamp)})
+        writer = None
+        persisted = False
+        try:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                writer = pq.ParquetWriter(tmp_path, schema, compression='zstd')
+                batch = []
+                for entry in entries:
+                    # Hand the entry on first, so a failed write cannot drop it
+                    yield entry
+                    batch.append(entry)
+                    if len(batch) == PARQUET_BATCH_ROWS:
+                        writer.write_table(pa.Table.from_pylist(batch, schema))
+                        batch.clear()
+                if batch:
+                    writer.write_table(pa.Table.from_pylist(batch, schema))
+                writer.close()
+                os.replace(tmp_path, path)
+                persisted = True
+            except (OSError, pa.ArrowException) as e:
+                print(f"Warning: could not write cache {path}: {e}")
+                yield from entries
+        finally:
+            if not persisted:
+                if writer is not None:
+                    with contextlib.suppress(OSError, pa.ArrowException):
+                        writer.close()
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink(missing_ok=True)
+
+    def _save_cache(self, stamp: int):
+        """Persist collected results; failures only cost a future rescan."""
+        cached = {
+            'stamp': stamp,
+            'threshold_mb': self.threshold_mb,
+            'max_keep': self.max_keep,
+            'rfstat_data': self.rfstat_data,
+            'rotation_stats': self._rotation_stats,
+            'large_logs': self._large_logs
         }
-        
-        for entry in self.rfstat_data['entries']:
-            if entry['is_dir']:
+        path = self._cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(cached))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not write cache {path}: {e}")
+
+    def _collect_parallel(self, subdirs: List[Path]) -> Dict[str, Any]:
+        """Run rfstat on each subdirectory in parallel and merge the results.
+
+        Files directly inside `log_dir` are picked up by one extra,
+        non-recursive run on `log_dir` itself.
+        """
+        with ProcessPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(self._run_rfstat_one, self.log_dir, False)]
+            futures += [executor.submit(self._run_rfstat_one, sub) for sub in subdirs]
+            partials = [future.result() for future in futures]
+
+        return self._merge(partials)
+
+    def _run_rfstat_one(self, path: Path, recursive: bool = True):
+        """Collect a single directory (in a worker process) and return its partial results."""
+        analyzer = LogAnalyzer(path, self.threshold_mb, self.max_keep, recursive=recursive)
+        summary = analyzer.collect_stats()
+        return summary, analyzer._rotation_stats, analyzer._large_logs
+
+    def _merge(self, partials) -> Dict[str, Any]:
+        """Combine per-directory (summary, rotation stats, large logs) results."""
+        totals = Counter()
+        size_distribution = Counter()
+        file_types = {}
+        rotation = Counter()
+        large_logs = []
+
+        for summary, rotation_stats, partial_large_logs in partials:
+            totals.update({key: summary[key]
+                           for key in ('total_files', 'total_dirs', 'total_size')})
+            # Counter.update keeps zero counts, unlike `+=`
+            size_distribution.update(summary['size_distribution'])
+            for file_type, type_stats in summary['file_types'].items():
+                file_types.setdefault(file_type, Counter()).update(
+                    count=type_stats['count'], total_size=type_stats['total_size'])
+            rotation.update({key: value for key, value in rotation_stats.items()
+                             if key != 'rotation_efficiency'})
+            large_logs.extend(partial_large_logs)
+
+        self._rotation_stats = self._rotation_summary(
+            rotation['current_logs'], rotation['rotated_logs'], rotation['compressed_logs'],
+            rotation['total_current_size'], rotation['total_rotated_size']
+        )
+        self._large_logs = heapq.nlargest(self.max_keep, large_logs)
+        heapq.heapify(self._large_logs)
+
+        total_files = totals['total_files']
+        return {
+            'total_files': total_files,
+            'total_dirs': totals['total_dirs'],
+            'total_size': totals['total_size'],
+            'avg_file_size': totals['total_size'] // total_files if total_files else 0,
+            'max_file_size': max(summary['max_file_size'] for summary, _, _ in partials),
+            'min_file_size': min(summary['min_file_size'] for summary, _, _ in partials),
+            'file_types': {
+                file_type: {**stats, 'avg_size': stats['total_size'] // stats['count']}
+                for file_type, stats in file_types.items()
+            },
+            'size_distribution': dict(size_distribution)
+        }
+
+    def _rfstat_args(self, output_format: str, *paths: Path) -> List[str]:
+        """Build the rfstat command line for the given format and paths (default: log_dir)."""
+        args = [
+            'rfstat', *map(str, paths or [self.log_dir]),
+            '--format', output_format,
+            '--extensions', 'log,gz,1,2,3,4,5',
+            '--show-times',
+            '--quiet'
+        ]
+        if not self.recursive:
+            args.append('--no-recursive')
+        return args
+
+    @classmethod
+    def _collect_sections(cls, analyzers: List['LogAnalyzer']) -> Optional[List[Dict[str, Any]]]:
+        """Run rfstat once for all analyzers, skipping entries unless one persists them."""
+        if not any(analyzer._keeps_entries for analyzer in analyzers):
+            summaries = cls._collect_jsonl(analyzers, summary_only=True)
+            if summaries is not None:
+                return summaries
+            # rfstat predates --top-files; stream the entries instead
+        return cls._collect_jsonl(analyzers)
+
+    @staticmethod
+    def _collect_jsonl(analyzers: List['LogAnalyzer'],
+                       summary_only: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Scan rfstat's JSON Lines output for one or more analyzers in a single run.
+
+        rfstat writes one section per path, in argument order, so each
+        analyzer scans its own section as it streams past. With
+        `summary_only`, each section is a single summary record carrying
+        the largest files. Returns the summary records, or None if rfstat
+        rejected the arguments.
+        """
+        args = analyzers[0]._rfstat_args('jsonl', *(a.log_dir for a in analyzers))
+        if summary_only:
+            top_files = max(analyzer.max_keep for analyzer in analyzers)
+            args += ['--summary-only', '--top-files', str(top_files)]
+        summaries = []
+        # stderr goes to a file rather than a pipe: rfstat may log more than a
+        # pipe buffer of warnings (RUST_LOG overrides --quiet) while stdout is read
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=stderr_file,
+                                  bufsize=1 << 20) as proc:
+                sections = iter_rfstat_jsonl(proc.stdout)
+                for analyzer, (summary, entries) in zip(analyzers, sections):
+                    if summary_only:
+                        analyzer._scan_summary(summary)
+                    else:
+                        entries = analyzer._persist_entries(entries)
+                        analyzer._scan_entries(map(LogEntry.from_dict, entries))
+                    summaries.append(summary)
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+
+        # clap exits with status 2 on unknown arguments or argument values
+        if not summaries and proc.returncode == 2:
+            return None
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, args, stderr=stderr)
+        return summaries
+
+    def _collect_json(self) -> Dict[str, Any]:
+        """Scan rfstat's single JSON document, streaming it when ijson is available.
+
+        Otherwise the whole document is loaded before its entries are scanned.
+        """
+        summary = {}
+        args = self._rfstat_args('json')
+        with subprocess.Popen(args, stdout=subprocess.PIPE) as proc:
+            if ijson is not None:
+                entries = iter_rfstat_json(proc.stdout, summary)
+            else:
+                summary = json_loads(proc.stdout.read())
+                entries = summary.pop('entries')
+            self._scan_entries(map(LogEntry.from_dict, self._persist_entries(entries)))
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, args)
+        return summary
+
+    @property
+    def _keeps_entries(self) -> bool:
+        """Whether collected entries are persisted to the Parquet cache."""
+        return pa is not None and self.cache_dir is not None
+
+    def _scan_summary(self, summary: Dict[str, Any]):
+        """Compute rotation stats and large logs from rfstat's per-type totals and top files.
+
+        `top_files` is removed from the summary, which is kept as `rfstat_data`.
+        """
+        counts = [0, 0, 0]
+        sizes = [0, 0, 0]
+        for file_type, type_stats in summary['file_types'].items():
+            bucket = LOG_BUCKETS.get(file_type)
+            if bucket is not None:
+                counts[bucket] += type_stats['count']
+                sizes[bucket] += type_stats['total_size']
+
+        self._rotation_stats = self._rotation_summary(
+            counts[BUCKET_CURRENT], counts[BUCKET_ROTATED], counts[BUCKET_COMPRESSED],
+            sizes[BUCKET_CURRENT], sizes[BUCKET_COMPRESSED] + sizes[BUCKET_ROTATED]
+        )
+
+        # top_files is sorted largest first and may hold more than max_keep files
+        threshold_bytes = self.threshold_mb * 1024 * 1024
+        self._large_logs = [
+            (entry.size, entry.path, entry.file_type, entry.modified)
+            for entry in map(LogEntry.from_dict, summary.pop('top_files'))
+            if entry.file_type in LOG_BUCKETS and entry.size > threshold_bytes
+        ][:self.max_keep]
+        heapq.heapify(self._large_logs)
+
+    def _scan_entries(self, entries: Iterable[LogEntry]):
+        """Compute rotation stats and large logs in a single pass over entries."""
+        # File count and total size per rotation bucket
+        counts = [0, 0, 0]
+        sizes = [0, 0, 0]
+        bucket_of = LOG_BUCKETS.get
+        threshold_bytes = self.threshold_mb * 1024 * 1024
+        max_keep = self.max_keep
+        # Min-heap of (size, path, file_type, modified) holding the largest logs
+        large_logs = []
+
+        for entry in entries:
+            if entry.is_dir:
                 continue
-                
-            file_type = entry.get('file_type', '')
-            size = entry['size']
-            
-            if file_type == 'log':
-                rotation_stats['current_logs'] += 1
-                rotation_stats['total_current_size'] += size
-            elif file_type in ['gz', '1', '2', '3', '4', '5']:
-                if file_type == 'gz':
-                    rotation_stats['compressed_logs'] += 1
+
+            bucket = bucket_of(entry.file_type)
+            if bucket is None:
+                continue
+
+            size = entry.size
+            counts[bucket] += 1
+            sizes[bucket] += size
+
+            if size > threshold_bytes:
+                item = (size, entry.path, entry.file_type, entry.modified)
+                if len(large_logs) < max_keep:
+                    heapq.heappush(large_logs, item)
                 else:
-                    rotation_stats['rotated_logs'] += 1
-                rotation_stats['total_rotated_size'] += size
-        
+                    heapq.heappushpop(large_logs, item)
+
+        self._rotation_stats = self._rotation_summary(
+            counts[BUCKET_CURRENT], counts[BUCKET_ROTATED], counts[BUCKET_COMPRESSED],
+            sizes[BUCKET_CURRENT], sizes[BUCKET_COMPRESSED] + sizes[BUCKET_ROTATED]
+        )
+        self._large_logs = large_logs
+
+    @staticmethod
+    def _rotation_summary(current_logs: int, rotated_logs: int, compressed_logs: int,
+                          total_current_size: int, total_rotated_size: int) -> Dict[str, Any]:
+        """Assemble the rotation stats dict, including rotation efficiency."""
         # Calculate rotation efficiency (compression ratio)
-        if rotation_stats['total_current_size'] > 0:
-            rotation_stats['rotation_efficiency'] = (
-                rotation_stats['total_rotated_size'] / 
-                rotation_stats['total_current_size']
-            )
-        
-        return rotation_stats
+        rotation_efficiency = 0
+        if total_current_size > 0:
+            rotation_efficiency = total_rotated_size / total_current_size
+
+        return {
+            'current_logs': current_logs,
+            'rotated_logs': rotated_logs,
+            'compressed_logs': compressed_logs,
+            'total_current_size': total_current_size,
+            'total_rotated_size': total_rotated_size,
+            'rotation_efficiency': rotation_efficiency
+        }
     
-    def find_large_logs(self, threshold_mb: int = 100) -> List[Dict[str, Any]]:
-        """Find log files larger than threshold."""
-        if not self.rfstat_data:
+    def _ensure_collected(self):
+        """Run collect_stats unless its results are already available."""
+        if self.rfstat_data is None:
             self.collect_stats()
-        
-        threshold_bytes = threshold_mb * 1024 * 1024
-        large_logs = []
-        
-        for entry in self.rfstat_data['entries']:
-            if (not entry['is_dir'] and 
-                entry['size'] > threshold_bytes and
-                entry.get('file_type') in ['log', 'gz', '1', '2', '3', '4', '5']):
-                
-                large_logs.append({
-                    'path': entry['path'],
-                    'size_mb': entry['size'] / (1024 * 1024),
-                    'file_type': entry.get('file_type', 'unknown'),
-                    'modified': entry.get('modified', '')
-                })
-        
-        return sorted(large_logs, key=lambda x: x['size_mb'], reverse=True)
+
+    def analyze_log_rotation(self) -> Dict[str, Any]:
+        """Analyze log rotation patterns."""
+        self._ensure_collected()
+        return self._rotation_stats
+    
+    def find_large_logs(self, threshold_mb: int = None, k: int = None) -> List[LogEntry]:
+        """Find the `k` largest log files above threshold, largest first.
+
+        Defaults to the analyzer's threshold and to every file retained
+        during collection (at most `max_keep`). Files below the collection
+        threshold were not retained, so a lower threshold is answered by a
+        separate rfstat run; the analyzer's own threshold and results are
+        left unchanged.
+        """
+        self._ensure_collected()
+
+        query = (threshold_mb, k)
+        if query in self._large_logs_by_query:
+            return self._large_logs_by_query[query]
+
+        if threshold_mb is not None and threshold_mb < self.threshold_mb:
+            rescan = LogAnalyzer(self.log_dir, threshold_mb, self.max_keep,
+                                 recursive=self.recursive)
+            self._large_logs_by_query[query] = rescan.find_large_logs(k=k)
+        else:
+            largest = heapq.nlargest(k or len(self._large_logs), self._large_logs)
+            if threshold_mb is not None and threshold_mb > self.threshold_mb:
+                threshold_bytes = threshold_mb * 1024 * 1024
+                largest = [item for item in largest if item[0] > threshold_bytes]
+
+            self._large_logs_by_query[query] = [
+                LogEntry(path, size, False, file_type, modified)
+                for size, path, file_type, modified in largest
+            ]
+        return self._large_logs_by_query[query]
     
     def analyze_growth_patterns(self) -> Dict[str, Any]:
         """Analyze log growth patterns over time."""
         # This would require historical data - simplified version
-        if not self.rfstat_data:
-            self.collect_stats()
+        self._ensure_collected()
+        if self._growth_patterns is None:
+            self._growth_patterns = {
+                'total_size_gb': self.rfstat_data['total_size'] / (1024**3),
+                'file_count': self.rfstat_data['total_files'],
+                'avg_file_size_mb': self.rfstat_data['avg_file_size'] / (1024**2),
+                'size_distribution': self.rfstat_data['size_distribution']
+            }
         
-        patterns = {
-            'total_size_gb': self.rfstat_data['total_size'] / (1024**3),
-            'file_count': self.rfstat_data['total_files'],
-            'avg_file_size_mb': self.rfstat_data['avg_file_size'] / (1024**2),
-            'size_distribution': self.rfstat_data['size_distribution']
-        }
-        
-        return patterns
+        return self._growth_patterns
     
-    def generate_report(self, output_file: str = None):
-        """Generate a comprehensive analysis report."""
-        if not self.rfstat_data:
-            self.collect_stats()
-        
+    def generate_report(self, output_file: str = None, append: bool = False):
+        """Generate a comprehensive analysis report.
+
+        With `append`, the report is added to the end of `output_file`.
+        """
+        from datetime import datetime
+
+        # The accessors are memoized, so the report and charts share one collection
         rotation_stats = self.analyze_log_rotation()
-        large_logs = self.find_large_logs()
+        large_logs = self.find_large_logs(k=10)
         growth_patterns = self.analyze_growth_patterns()
         
-        report = f"""
+        header = f"""
 # Log Analysis Report
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Directory: {self.log_dir}
@@ -154,89 +795,181 @@ Directory: {self.log_dir}
 - Large (100MB-1GB): {growth_patterns['size_distribution']['large']}
 - Huge (> 1GB): {growth_patterns['size_distribution']['huge']}
 
-## Large Log Files (> 100MB)
+## Large Log Files (> {self.threshold_mb}MB)
 """
         
-        for log in large_logs[:10]:  # Top 10 largest
-            report += f"- {log['path']}: {log['size_mb']:.2f} MB ({log['file_type']})\n"
+        lines = [f"- {log.path}: {log.size_mb:.2f} MB ({log.file_type})\n"
+                 for log in large_logs]  # Top 10 largest
         
+        # Write the pieces as they are rather than concatenating one report string
         if output_file:
-            with open(output_file, 'w') as f:
-                f.write(report)
+            with open(output_file, 'a' if append else 'w', buffering=1 << 16) as f:
+                f.write(header)
+                f.writelines(lines)
             print(f"Report saved to: {output_file}")
         else:
-            print(report)
+            sys.stdout.write(header)
+            sys.stdout.writelines(lines)
+            sys.stdout.write('\n')
     
-    def create_visualization(self, output_dir: str = "."):
-        """Create visualizations of log data."""
-        if not self.rfstat_data:
-            self.collect_stats()
+    def report_data(self) -> Dict[str, Any]:
+        """Collect the report's figures as a JSON-serializable dict."""
+        from datetime import datetime
+
+        return {
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'directory': str(self.log_dir),
+            'threshold_mb': self.threshold_mb,
+            'summary': self.analyze_growth_patterns(),
+            'rotation': self.analyze_log_rotation(),
+            'large_logs': [
+                {'path': log.path, 'size': log.size,
+                 'file_type': log.file_type, 'modified': log.modified}
+                for log in self.find_large_logs(k=10)
+            ]
+        }
+    
+    def create_visualization(self, output_dir: str = ".", rich: bool = False):
+        """Create visualizations of log data.
+
+        Charts are written as standalone SVG files by default. With `rich`,
+        they are rendered as PNG with matplotlib instead.
+        """
+        dist = self.analyze_growth_patterns()['size_distribution']
         
         output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
+        output_path.mkdir(parents=True, exist_ok=True)
         
         # Size distribution pie chart
-        dist = self.rfstat_data['size_distribution']
         labels = ['Tiny (<1KB)', 'Small (1KB-1MB)', 'Medium (1MB-100MB)', 
                  'Large (100MB-1GB)', 'Huge (>1GB)']
         sizes = [dist['tiny'], dist['small'], dist['medium'], dist['large'], dist['huge']]
         
-        plt.figure(figsize=(10, 8))
-        plt.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90)
-        plt.title('Log File Size Distribution')
-        plt.savefig(output_path / 'size_distribution.png')
-        plt.close()
-        
         # File type breakdown
         file_types = self.rfstat_data.get('file_types', {})
-        if file_types:
-            types = list(file_types.keys())
-            counts = [file_types[t]['count'] for t in types]
-            
-            plt.figure(figsize=(12, 6))
-            plt.bar(types, counts)
-            plt.title('Log Files by Type')
-            plt.xlabel('File Type')
-            plt.ylabel('Count')
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(output_path / 'file_types.png')
-            plt.close()
+        types = list(file_types.keys())
+        counts = [file_types[t]['count'] for t in types]
+
+        if rich:
+            self._plot_matplotlib(output_path, sizes, labels, types, counts)
+        else:
+            _svg_pie(sizes, labels, output_path / 'size_distribution.svg',
+                     'Log File Size Distribution')
+            if types:
+                _svg_bar(types, counts, output_path / 'file_types.svg', 'Log Files by Type')
         
         print(f"Visualizations saved to: {output_path}")
 
+    @staticmethod
+    def _plot_matplotlib(output_path: Path, sizes: List[int], labels: List[str],
+                         types: List[str], counts: List[int]):
+        """Render the charts as PNG with matplotlib.
+
+        Charts are rendered off-screen with the Agg backend and each figure
+        is closed as soon as it is saved, so repeated calls (e.g. one per
+        directory) do not accumulate canvas buffers.
+        """
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=(10, 8))
+        ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90)
+        ax.set_title('Log File Size Distribution')
+        fig.savefig(output_path / 'size_distribution.png')
+        plt.close(fig)
+        
+        if types:
+            fig, ax = plt.subplots(figsize=(12, 6))
+            ax.bar(types, counts)
+            ax.set_title('Log Files by Type')
+            ax.set_xlabel('File Type')
+            ax.set_ylabel('Count')
+            ax.tick_params(axis='x', labelrotation=45)
+            fig.tight_layout()
+            fig.savefig(output_path / 'file_types.png')
+            plt.close(fig)
+
+        # Figures hold reference cycles; reclaim their buffers now rather than later
+        del fig, ax
+        gc.collect()
+
+def _chart_subdirs(log_dirs: List[Path]) -> List[str]:
+    """Name a chart subdirectory per log directory, unique even when basenames clash.
+
+    Directories are named after their basename; clashing (or empty) names get
+    a short hash of the resolved path appended, e.g. `log-3f2a9c1b`.
+    """
+    resolved = [log_dir.resolve() for log_dir in log_dirs]
+    names = Counter(path.name for path in resolved)
+    subdirs = []
+    for path in resolved:
+        if path.name and names[path.name] == 1:
+            subdirs.append(path.name)
+        else:
+            digest = hashlib.sha1(str(path).encode()).hexdigest()[:8]
+            subdirs.append(f"{path.name or 'root'}-{digest}")
+    return subdirs
+
 def main():
     parser = argparse.ArgumentParser(description='Analyze log directories using rfstat')
-    parser.add_argument('log_dir', help='Path to log directory')
+    parser.add_argument('log_dirs', nargs='+', metavar='log_dir',
+                       help='Path to log directory (several may be given)')
     parser.add_argument('--report', '-r', help='Output file for text report')
+    parser.add_argument('--json', metavar='FILE',
+                       help='Also write the report as JSON, one object per directory')
     parser.add_argument('--visualize', '-v', action='store_true', 
                        help='Create visualizations')
+    parser.add_argument('--rich-plots', action='store_true',
+                       help='Render visualizations as PNG with matplotlib instead of SVG')
     parser.add_argument('--output-dir', '-o', default='.', 
                        help='Output directory for visualizations')
     parser.add_argument('--threshold', '-t', type=int, default=100,
                        help='Threshold in MB for large file detection')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of parallel rfstat processes (one per subdirectory)')
+    parser.add_argument('--cache', action='store_true',
+                       help=f'Reuse results cached in {DEFAULT_CACHE_DIR} while the '
+                            'directory is unchanged')
     
     args = parser.parse_args()
     
     # Check if rfstat is available
-    try:
-        subprocess.run(['rfstat', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not rfstat_available():
         print("Error: rfstat command not found. Please install rfstat first.")
         sys.exit(1)
     
-    # Create analyzer and run analysis
-    analyzer = LogAnalyzer(args.log_dir)
+    # Create analyzers and run analysis
+    analyzers = [
+        LogAnalyzer(log_dir, args.threshold, concurrency=args.jobs,
+                    cache_dir=DEFAULT_CACHE_DIR if args.cache else None)
+        for log_dir in args.log_dirs
+    ]
     
     try:
-        analyzer.generate_report(args.report)
+        LogAnalyzer.collect_batch(analyzers)
+
+        for index, analyzer in enumerate(analyzers):
+            analyzer.generate_report(args.report, append=index > 0)
+
+        if args.json:
+            with open(args.json, 'wb') as f:
+                f.write(json_dumps([analyzer.report_data() for analyzer in analyzers],
+                                   indent=True))
+            print(f"JSON report saved to: {args.json}")
         
         if args.visualize:
             try:
-                analyzer.create_visualization(args.output_dir)
+                # Keep each directory's charts apart when several are analyzed
+                subdirs = _chart_subdirs([analyzer.log_dir for analyzer in analyzers])
+                for analyzer, subdir in zip(analyzers, subdirs):
+                    output_dir = Path(args.output_dir)
+                    if len(analyzers) > 1:
+                        output_dir /= subdir
+                    analyzer.create_visualization(output_dir, rich=args.rich_plots)
             except ImportError:
                 print("Warning: matplotlib not available, skipping visualizations")
-                print("Install with: pip install matplotlib pandas")
+                print("Install with: pip install matplotlib, or omit --rich-plots for SVG charts")
     
     except KeyboardInterrupt:
         print("\nAnalysis interrupted by user")
@@ -16,6 +16,7 @@ use std::path::PathBuf;
 /// Examples:
 ///   rfstat                           # Analyze current directory
 ///   rfstat /var/log                  # Analyze specific directory
+///   rfstat /var/log/app1 /var/log/app2  # Analyze several directories in one run
 ///   rfstat . --format json           # Output as JSON
 ///   rfstat /home --sort size --limit 10  # Top 10 largest files
 #[derive(Parser, Debug)]
@@ -27,9 +28,9 @@ use std::path::PathBuf;
     author = "Your Name <your.email@example.com>"
 )]
 pub struct Cli {
-    /// Path to analyze (defaults to current directory)
+    /// Paths to analyze, each reported in turn (defaults to current directory)
     #[arg(value_name = "PATH", default_value = ".")]
-    pub path: PathBuf,
+    pub paths: Vec<PathBuf>,
 
     /// Output format
     #[arg(short, long, value_enum, default_value_t = CliOutputFormat::Table)]
@@ -59,6 +60,10 @@ pub struct Cli {
     #[arg(long)]
     pub summary_only: bool,
 
+    /// Include the N largest files as "top_files" in JSON and JSON Lines output
+    #[arg(long, value_name = "N")]
+    pub top_files: Option<usize>,
+
     /// Filter by file extension (e.g., "txt,log,conf")
     #[arg(long, value_name = "EXTENSIONS")]
     pub extensions: Option<String>,
@@ -95,6 +100,8 @@ pub enum CliOutputFormat {
     Table,
     /// JSON format for programmatic use
     Json,
+    /// JSON Lines: a summary record, then one record per entry
+    Jsonl,
     /// CSV format for spreadsheet import
     Csv,
     /// Compact summary format
@@ -106,6 +113,7 @@ impl From<CliOutputFormat> for OutputFormat {
         match cli_format {
             CliOutputFormat::Table => OutputFormat::Table,
             CliOutputFormat::Json => OutputFormat::Json,
+            CliOutputFormat::Jsonl => OutputFormat::Jsonl,
             CliOutputFormat::Csv => OutputFormat::Csv,
             CliOutputFormat::Summary => OutputFormat::Summary,
         }
@@ -145,6 +153,7 @@ impl Cli {
             show_hidden: self.all,
             recursive: !self.no_recursive,
             max_depth: self.depth,
+            top_files: self.top_files,
         }
     }
 
@@ -214,7 +223,7 @@ impl Cli {
 impl Default for Cli {
     fn default() -> Self {
         Self {
-            path: PathBuf::from("."),
+            paths: vec![PathBuf::from(".")],
             format: CliOutputFormat::Table,
             sort: CliSortBy::Name,
             all: false,
@@ -222,6 +231,7 @@ impl Default for Cli {
             depth: None,
             limit: None,
             summary_only: false,
+            top_files: None,
             extensions: None,
             min_size: None,
             max_size: None,
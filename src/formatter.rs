@@ -5,9 +5,11 @@
 //! Each format is optimized for different use cases and workflows.
 
 use crate::error::Result;
-use crate::types::{FileStats, OutputFormat};
+use crate::types::{FileEntry, FileStats, OutputFormat, SizeDistribution, TypeStats};
 use colored::*;
+use serde::Serialize;
 use serde_json;
+use std::collections::HashMap;
 use std::io::Write;
 use tabled::{Table, Tabled};
 
@@ -42,6 +44,7 @@ pub fn format_output<W: Write>(
     match format {
         OutputFormat::Table => format_table(stats, writer, options),
         OutputFormat::Json => format_json(stats, writer, options),
+        OutputFormat::Jsonl => format_jsonl(stats, writer, options),
         OutputFormat::Csv => format_csv(stats, writer, options),
         OutputFormat::Summary => format_summary(stats, writer, options),
     }
@@ -285,16 +288,54 @@ fn write_file_types_table<W: Write>(
 }
 
 /// Formats output as JSON.
+///
+/// With `summary_only`, the individual entries are left out of the document.
 fn format_json<W: Write>(
     stats: &FileStats,
     writer: &mut W,
-    _options: &FormatterOptions,
+    options: &FormatterOptions,
 ) -> Result<()> {
-    let json = serde_json::to_string_pretty(stats)?;
+    let json = if options.summary_only {
+        serde_json::to_string_pretty(&StatsSummary::new(stats))?
+    } else {
+        serde_json::to_string_pretty(stats)?
+    };
     writeln!(writer, "{json}")?;
     Ok(())
 }
 
+/// Formats output as JSON Lines.
+///
+/// The first line holds the summary statistics (everything except the
+/// entries); each following line is a single file entry. Consumers can
+/// process entries as they arrive instead of parsing one large document.
+/// With `summary_only`, only the summary line is written.
+fn format_jsonl<W: Write>(
+    stats: &FileStats,
+    writer: &mut W,
+    options: &FormatterOptions,
+) -> Result<()> {
+    serde_json::to_writer(&mut *writer, &StatsSummary::new(stats))?;
+    writeln!(writer)?;
+
+    if options.summary_only {
+        return Ok(());
+    }
+
+    let entries = if let Some(limit) = options.limit {
+        &stats.entries[..stats.entries.len().min(limit)]
+    } else {
+        &stats.entries
+    };
+
+    for entry in entries {
+        serde_json::to_writer(&mut *writer, entry)?;
+        writeln!(writer)?;
+    }
+
+    Ok(())
+}
+
 /// Formats output as CSV.
 fn format_csv<W: Write>(
     stats: &FileStats,
@@ -382,6 +423,38 @@ fn format_number(n: u64) -> String {
     result
 }
 
+/// Statistics without the individual entries, written as the first line of
+/// JSON Lines output and as the JSON document with `--summary-only`.
+#[derive(Serialize)]
+struct StatsSummary<'a> {
+    total_files: u64,
+    total_dirs: u64,
+    total_size: u64,
+    avg_file_size: u64,
+    max_file_size: u64,
+    min_file_size: u64,
+    file_types: &'a HashMap<String, TypeStats>,
+    size_distribution: &'a SizeDistribution,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    top_files: Option<&'a Vec<FileEntry>>,
+}
+
+impl<'a> StatsSummary<'a> {
+    fn new(stats: &'a FileStats) -> Self {
+        Self {
+            total_files: stats.total_files,
+            total_dirs: stats.total_dirs,
+            total_size: stats.total_size,
+            avg_file_size: stats.avg_file_size,
+            max_file_size: stats.max_file_size,
+            min_file_size: stats.min_file_size,
+            file_types: &stats.file_types,
+            size_distribution: &stats.size_distribution,
+            top_files: stats.top_files.as_ref(),
+        }
+    }
+}
+
 /// Table row structure for file details.
 #[derive(Tabled)]
 struct FileTableRow {
@@ -435,6 +508,64 @@ mod tests {
         assert!(json_str.contains("total_size"));
     }
 
+    #[test]
+    fn test_format_jsonl() {
+        let mut stats = FileStats::new();
+        stats.total_files = 1;
+        stats.entries.push(crate::types::FileEntry {
+            path: std::path::PathBuf::from("app.log"),
+            size: 42,
+            is_dir: false,
+            modified: chrono::Utc::now(),
+            permissions: 0o644,
+            file_type: Some("log".to_string()),
+        });
+        let mut output = Vec::new();
+        let options = FormatterOptions::default();
+
+        format_jsonl(&stats, &mut output, &options).unwrap();
+
+        let jsonl_str = String::from_utf8(output).unwrap();
+        let lines: Vec<&str> = jsonl_str.lines().collect();
+        assert_eq!(lines.len(), 2);
+
+        let summary: serde_json::Value = serde_json::from_str(lines[0]).unwrap();
+        assert_eq!(summary["total_files"], 1);
+        assert!(summary.get("entries").is_none());
+
+        let entry: serde_json::Value = serde_json::from_str(lines[1]).unwrap();
+        assert_eq!(entry["path"], "app.log");
+        assert_eq!(entry["size"], 42);
+    }
+
+    #[test]
+    fn test_format_json_summary_only() {
+        let mut stats = FileStats::new();
+        let entry = crate::types::FileEntry {
+            path: std::path::PathBuf::from("app.log"),
+            size: 42,
+            is_dir: false,
+            modified: chrono::Utc::now(),
+            permissions: 0o644,
+            file_type: Some("log".to_string()),
+        };
+        stats.total_files = 1;
+        stats.top_files = Some(vec![entry.clone()]);
+        stats.entries.push(entry);
+        let mut output = Vec::new();
+        let options = FormatterOptions {
+            summary_only: true,
+            ..Default::default()
+        };
+
+        format_json(&stats, &mut output, &options).unwrap();
+
+        let parsed: serde_json::Value = serde_json::from_slice(&output).unwrap();
+        assert_eq!(parsed["total_files"], 1);
+        assert!(parsed.get("entries").is_none());
+        assert_eq!(parsed["top_files"][0]["path"], "app.log");
+    }
+
     #[test]
     fn test_format_summary() {
         let stats = FileStats::new();
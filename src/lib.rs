@@ -75,4 +75,5 @@ pub const DEFAULT_CONFIG: Config = Config {
     show_hidden: false,
     recursive: true,
     max_depth: None,
+    top_files: None,
 };
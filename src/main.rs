@@ -7,10 +7,11 @@
 use clap::Parser;
 use log::{debug, error, info};
 use rfstat::{
-    calculate_stats, filter_entries, format_output, scan_directory, scanner::FileFilters,
-    sort_entries, Cli, FormatterOptions, Result, RfstatError,
+    calculate_stats, filter_entries, format_output, get_largest_files, scan_directory,
+    scanner::FileFilters, sort_entries, Cli, Config, FormatterOptions, Result, RfstatError,
 };
-use std::io::{self, IsTerminal};
+use std::io::{self, BufWriter, IsTerminal, Write};
+use std::path::Path;
 use std::process;
 
 fn main() {
@@ -35,27 +36,85 @@ fn main() {
 
 /// Main application logic.
 fn run(cli: Cli) -> Result<()> {
-    debug!("Starting rfstat with path: {}", cli.path.display());
+    debug!("Starting rfstat with paths: {:?}", cli.paths);
+
+    // JSON and CSV output must stay a single document
+    if cli.paths.len() > 1
+        && matches!(
+            cli.format,
+            rfstat::cli::CliOutputFormat::Json | rfstat::cli::CliOutputFormat::Csv
+        )
+    {
+        return Err(RfstatError::config(
+            "json and csv output take a single PATH; use --format jsonl for several paths",
+        ));
+    }
 
-    // Validate input path
-    if !cli.path.exists() {
-        return Err(RfstatError::path_not_found(&cli.path));
+    // Validate all input paths before producing any output
+    if let Some(missing) = cli.paths.iter().find(|path| !path.exists()) {
+        return Err(RfstatError::path_not_found(missing));
     }
 
     // Convert CLI args to config
     let config = cli.to_config();
     debug!("Configuration: {config:?}");
 
+    let filters = create_file_filters(&cli)?;
+
+    // Create formatter options
+    let formatter_options = FormatterOptions {
+        use_colors: should_use_colors(&cli),
+        limit: cli.limit,
+        summary_only: cli.summary_only,
+        show_permissions: cli.show_permissions,
+        show_times: cli.show_times,
+        show_file_types: !cli.summary_only,
+    };
+
+    // A locked stdout is line-buffered, which would cost one write per
+    // JSON Lines entry
+    let stdout = io::stdout();
+    let mut handle = BufWriter::new(stdout.lock());
+
+    // Human-readable formats label each section when several paths are given;
+    // JSON Lines starts each path's section with its summary line
+    let label_sections = cli.paths.len() > 1
+        && matches!(
+            cli.format,
+            rfstat::cli::CliOutputFormat::Table | rfstat::cli::CliOutputFormat::Summary
+        );
+
+    for (index, path) in cli.paths.iter().enumerate() {
+        if label_sections {
+            if index > 0 {
+                writeln!(handle)?;
+            }
+            writeln!(handle, "{}:", path.display())?;
+        }
+        analyze_path(path, &config, &filters, &formatter_options, &mut handle)?;
+    }
+
+    handle.flush()?;
+    Ok(())
+}
+
+/// Scans, filters and sorts a single path, then writes its statistics.
+fn analyze_path<W: Write>(
+    path: &Path,
+    config: &Config,
+    filters: &FileFilters,
+    formatter_options: &FormatterOptions,
+    writer: &mut W,
+) -> Result<()> {
     // Scan the directory
-    info!("Scanning directory: {}", cli.path.display());
-    let mut entries = scan_directory(&cli.path, &config)?;
+    info!("Scanning directory: {}", path.display());
+    let mut entries = scan_directory(path, config)?;
     info!("Found {} entries", entries.len());
 
     // Apply additional filters from CLI
-    let filters = create_file_filters(&cli)?;
-    if has_active_filters(&filters) {
+    if has_active_filters(filters) {
         let original_count = entries.len();
-        entries = filter_entries(&entries, &filters);
+        entries = filter_entries(&entries, filters);
         debug!(
             "Filtered from {} to {} entries",
             original_count,
@@ -68,26 +127,22 @@ fn run(cli: Cli) -> Result<()> {
     debug!("Sorted entries by {:?}", config.sort_by);
 
     // Calculate statistics
-    let stats = calculate_stats(&entries);
+    let mut stats = calculate_stats(&entries);
     debug!(
         "Calculated statistics for {} files, {} directories",
         stats.total_files, stats.total_dirs
     );
 
-    // Create formatter options
-    let formatter_options = FormatterOptions {
-        use_colors: should_use_colors(&cli),
-        limit: cli.limit,
-        summary_only: cli.summary_only,
-        show_permissions: cli.show_permissions,
-        show_times: cli.show_times,
-        show_file_types: !cli.summary_only,
-    };
+    if let Some(n) = config.top_files {
+        let top_files = get_largest_files(&stats.entries, n)
+            .into_iter()
+            .cloned()
+            .collect();
+        stats.top_files = Some(top_files);
+    }
 
     // Format and output results
-    let stdout = io::stdout();
-    let mut handle = stdout.lock();
-    format_output(&stats, config.format, &mut handle, &formatter_options)?;
+    format_output(&stats, config.format, writer, formatter_options)?;
 
     info!(
         "Successfully processed {} files and {} directories",
@@ -155,7 +210,9 @@ fn should_use_colors(cli: &Cli) -> bool {
     }
 
     match cli.format {
-        rfstat::cli::CliOutputFormat::Json | rfstat::cli::CliOutputFormat::Csv => false,
+        rfstat::cli::CliOutputFormat::Json
+        | rfstat::cli::CliOutputFormat::Jsonl
+        | rfstat::cli::CliOutputFormat::Csv => false,
         rfstat::cli::CliOutputFormat::Table | rfstat::cli::CliOutputFormat::Summary => {
             io::stdout().is_terminal()
         }
@@ -232,7 +289,7 @@ mod tests {
     fn test_run_with_temp_directory() {
         let temp_dir = TempDir::new().unwrap();
         let cli = Cli {
-            path: temp_dir.path().to_path_buf(),
+            paths: vec![temp_dir.path().to_path_buf()],
             quiet: true,
             ..Default::default()
         };
@@ -242,10 +299,37 @@ mod tests {
         assert!(result.is_ok());
     }
 
+    #[test]
+    fn test_run_with_multiple_paths() {
+        let first = TempDir::new().unwrap();
+        let second = TempDir::new().unwrap();
+        let cli = Cli {
+            paths: vec![first.path().to_path_buf(), second.path().to_path_buf()],
+            quiet: true,
+            ..Default::default()
+        };
+
+        assert!(run(cli).is_ok());
+    }
+
+    #[test]
+    fn test_run_rejects_multiple_paths_for_json() {
+        let first = TempDir::new().unwrap();
+        let second = TempDir::new().unwrap();
+        let cli = Cli {
+            paths: vec![first.path().to_path_buf(), second.path().to_path_buf()],
+            format: rfstat::cli::CliOutputFormat::Json,
+            quiet: true,
+            ..Default::default()
+        };
+
+        assert!(matches!(run(cli), Err(RfstatError::Config { .. })));
+    }
+
     #[test]
     fn test_run_with_nonexistent_path() {
         let cli = Cli {
-            path: PathBuf::from("/nonexistent/path"),
+            paths: vec![PathBuf::from("/nonexistent/path")],
             ..Default::default()
         };
 
@@ -42,6 +42,7 @@ use std::collections::HashMap;
 pub fn calculate_stats(entries: &[FileEntry]) -> FileStats {
     let mut stats = FileStats::new();
     let mut file_sizes = Vec::new();
+    let mut size_buckets = [0u64; 5];
 
     // First pass: collect basic statistics
     for entry in entries {
@@ -53,7 +54,7 @@ pub fn calculate_stats(entries: &[FileEntry]) -> FileStats {
             file_sizes.push(entry.size);
 
             // Update size distribution
-            stats.size_distribution.add_size(entry.size);
+            size_buckets[SizeDistribution::bucket_index(entry.size)] += 1;
 
             // Update file type statistics
             let file_type = entry.file_type.as_deref().unwrap_or("no_extension");
@@ -63,6 +64,8 @@ pub fn calculate_stats(entries: &[FileEntry]) -> FileStats {
         }
     }
 
+    stats.size_distribution = SizeDistribution::from_counts(size_buckets);
+
     // Calculate derived statistics
     if let Some(avg) = stats.total_size.checked_div(stats.total_files) {
         stats.avg_file_size = avg;
@@ -375,4 +378,24 @@ mod tests {
         assert_eq!(stats.size_distribution.large, 1);
         assert_eq!(stats.size_distribution.huge, 1);
     }
+
+    #[test]
+    fn test_size_bucket_boundaries() {
+        let bounds = [
+            (0, 0),
+            (1023, 0),
+            (1024, 1),
+            (1048575, 1),
+            (1048576, 2),
+            (104857599, 2),
+            (104857600, 3),
+            (1073741823, 3),
+            (1073741824, 4),
+            (u64::MAX, 4),
+        ];
+
+        for (size, bucket) in bounds {
+            assert_eq!(SizeDistribution::bucket_index(size), bucket, "size {size}");
+        }
+    }
 }
@@ -100,6 +100,9 @@ pub struct FileStats {
     pub file_types: HashMap<String, TypeStats>,
     /// Size distribution buckets
     pub size_distribution: SizeDistribution,
+    /// Largest files, largest first, when requested with `--top-files`
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub top_files: Option<Vec<FileEntry>>,
     /// Individual file entries
     pub entries: Vec<FileEntry>,
 }
@@ -116,6 +119,7 @@ impl FileStats {
             min_file_size: u64::MAX,
             file_types: HashMap::new(),
             size_distribution: SizeDistribution::new(),
+            top_files: None,
             entries: Vec::new(),
         }
     }
@@ -207,15 +211,42 @@ impl SizeDistribution {
         }
     }
 
+    /// Lower bounds of the small, medium, large and huge buckets.
+    const BUCKET_BOUNDS: [u64; 4] = [1024, 1024 * 1024, 100 * 1024 * 1024, 1024 * 1024 * 1024];
+
+    /// Returns the bucket index of a file size, from 0 (tiny) to 4 (huge).
+    ///
+    /// Sizes are usually spread across buckets unpredictably, so the index is
+    /// computed by summing comparisons rather than by branching on each bound.
+    pub fn bucket_index(size: u64) -> usize {
+        Self::BUCKET_BOUNDS
+            .iter()
+            .map(|&bound| usize::from(size >= bound))
+            .sum()
+    }
+
+    /// Creates a size distribution from per-bucket counts, ordered tiny to huge.
+    pub fn from_counts(counts: [u64; 5]) -> Self {
+        let [tiny, small, medium, large, huge] = counts;
+        Self {
+            tiny,
+            small,
+            medium,
+            large,
+            huge,
+        }
+    }
+
     /// Adds a file size to the appropriate bucket.
     pub fn add_size(&mut self, size: u64) {
-        match size {
-            0..=1023 => self.tiny += 1,
-            1024..=1048575 => self.small += 1,
-            1048576..=104857599 => self.medium += 1,
-            104857600..=1073741823 => self.large += 1,
-            _ => self.huge += 1,
-        }
+        let bucket = match Self::bucket_index(size) {
+            0 => &mut self.tiny,
+            1 => &mut self.small,
+            2 => &mut self.medium,
+            3 => &mut self.large,
+            _ => &mut self.huge,
+        };
+        *bucket += 1;
     }
 }
 
@@ -233,6 +264,8 @@ pub enum OutputFormat {
     Table,
     /// JSON format for programmatic use
     Json,
+    /// JSON Lines format for streaming consumers
+    Jsonl,
     /// CSV format for spreadsheet import
     Csv,
     /// Compact summary format
@@ -266,6 +299,8 @@ pub struct Config {
     pub recursive: bool,
     /// Maximum depth for recursive scanning
     pub max_depth: Option<usize>,
+    /// Number of largest files to report separately from the entries
+    pub top_files: Option<usize>,
 }
 
 impl Default for Config {
@@ -276,6 +311,7 @@ impl Default for Config {
             show_hidden: false,
             recursive: true,
             max_depth: None,
+            top_files: None,
         }
     }
 }
@@ -66,6 +66,128 @@ fn test_json_output_format() {
         .stdout(predicate::str::contains("\"entries\""));
 }
 
+#[test]
+fn test_jsonl_output_format() {
+    let temp_dir = create_test_directory();
+
+    let mut cmd = cargo_bin_cmd!("rfstat");
+    let output = cmd
+        .arg(temp_dir.path())
+        .arg("--format")
+        .arg("jsonl")
+        .arg("--quiet")
+        .output()
+        .unwrap();
+
+    assert!(output.status.success());
+    let stdout = String::from_utf8(output.stdout).unwrap();
+    let mut lines = stdout.lines();
+
+    let summary: serde_json::Value = serde_json::from_str(lines.next().unwrap()).unwrap();
+    assert!(summary.get("total_files").is_some());
+    assert!(summary.get("entries").is_none());
+
+    let entries: Vec<serde_json::Value> = lines
+        .map(|line| serde_json::from_str(line).unwrap())
+        .collect();
+    assert!(!entries.is_empty());
+    assert!(entries.iter().all(|entry| entry.get("path").is_some()));
+}
+
+#[test]
+fn test_top_files_summary_only_json() {
+    let temp_dir = create_test_directory();
+
+    let mut cmd = cargo_bin_cmd!("rfstat");
+    let output = cmd
+        .arg(temp_dir.path())
+        .arg("--format")
+        .arg("json")
+        .arg("--summary-only")
+        .arg("--top-files")
+        .arg("2")
+        .arg("--quiet")
+        .output()
+        .unwrap();
+
+    assert!(output.status.success());
+    let parsed: serde_json::Value = serde_json::from_slice(&output.stdout).unwrap();
+    assert!(parsed.get("entries").is_none());
+
+    let top_files = parsed["top_files"].as_array().unwrap();
+    assert_eq!(top_files.len(), 2);
+    assert!(top_files[0]["path"]
+        .as_str()
+        .unwrap()
+        .ends_with("large.dat"));
+    assert!(top_files[1]["path"]
+        .as_str()
+        .unwrap()
+        .ends_with("medium.log"));
+}
+
+#[test]
+fn test_multiple_paths_rejected_for_json_and_csv() {
+    let first = create_test_directory();
+    let second = create_test_directory();
+
+    for format in ["json", "csv"] {
+        let mut cmd = cargo_bin_cmd!("rfstat");
+        cmd.arg(first.path())
+            .arg(second.path())
+            .arg("--format")
+            .arg(format)
+            .arg("--quiet");
+
+        cmd.assert()
+            .failure()
+            .stdout(predicate::str::is_empty())
+            .stderr(predicate::str::contains("single PATH"));
+    }
+}
+
+#[test]
+fn test_multiple_paths_jsonl_sections() {
+    let first = create_test_directory();
+    let second = create_test_directory();
+
+    let mut cmd = cargo_bin_cmd!("rfstat");
+    let output = cmd
+        .arg(first.path())
+        .arg(second.path())
+        .arg("--format")
+        .arg("jsonl")
+        .arg("--quiet")
+        .output()
+        .unwrap();
+
+    assert!(output.status.success());
+    let stdout = String::from_utf8(output.stdout).unwrap();
+    let records: Vec<serde_json::Value> = stdout
+        .lines()
+        .map(|line| serde_json::from_str(line).unwrap())
+        .collect();
+
+    // One summary record opens each path's section, in argument order
+    let summaries: Vec<usize> = records
+        .iter()
+        .enumerate()
+        .filter(|(_, record)| record.get("total_files").is_some())
+        .map(|(index, _)| index)
+        .collect();
+    assert_eq!(summaries.len(), 2);
+    assert_eq!(summaries[0], 0);
+
+    let first_root = first.path().to_string_lossy().to_string();
+    let second_root = second.path().to_string_lossy().to_string();
+    for record in &records[1..summaries[1]] {
+        assert!(record["path"].as_str().unwrap().starts_with(&first_root));
+    }
+    for record in &records[summaries[1] + 1..] {
+        assert!(record["path"].as_str().unwrap().starts_with(&second_root));
+    }
+}
+
 #[test]
 fn test_csv_output_format() {
     let temp_dir = create_test_directory();